@@ -1,7 +1,20 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import os
-import base64
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ===============================
 # PAGE CONFIG
@@ -16,7 +29,7 @@ st.set_page_config(
 # ===============================
 # STYLES
 # ===============================
-st.markdown("""
+_CSS = "".join(line.strip() for line in """
 <style>
 .main-header {
     text-align: center;
@@ -33,79 +46,159 @@ st.markdown("""
     box-shadow: 0 5px 15px rgba(0,0,0,.1);
     margin-bottom: 1rem;
 }
-.success {
-    background: linear-gradient(135deg, #4CAF50, #2e7d32);
-    color: white;
-    padding: 1rem;
-    border-radius: 10px;
-}
-.error {
-    background: linear-gradient(135deg, #f44336, #c62828);
-    color: white;
-    padding: 1rem;
-    border-radius: 10px;
-}
 </style>
-""", unsafe_allow_html=True)
+""".splitlines())
+
+def inject_css():
+    """Inject the custom CSS into the page"""
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 # ===============================
 # UTILITIES
 # ===============================
+@st.cache_data(ttl=10, show_spinner=False)
 def get_available_templates():
     """Auto-detect template-app*.py files"""
-    return sorted([
-        f for f in os.listdir(".")
-        if f.startswith("template-app") and f.endswith(".py")
-    ])
+    with os.scandir(".") as entries:
+        return sorted(
+            e.name for e in entries
+            if e.name.startswith("template-app") and e.name.endswith(".py") and e.is_file()
+        )
+
+@st.cache_data(show_spinner=False)
+def read_file_bytes(path, mtime_ns):
+    """Read a file as bytes, cached until its modification time changes"""
+    with open(path, "rb") as f:
+        return f.read()
+
+def read_file_cached(path):
+    """Read a file through the mtime-keyed cache"""
+    return read_file_bytes(path, os.stat(path).st_mtime_ns)
 
 def read_template(template_file):
     try:
-        with open(template_file, "r", encoding="utf-8") as f:
-            return f.read()
+        return read_file_cached(template_file)
     except Exception as e:
         st.error(f"❌ Failed to read {template_file}: {e}")
         return None
 
 def read_file(file):
     try:
-        with open(file, "r", encoding="utf-8") as f:
-            return f.read()
-    except:
-        return ""
+        return read_file_cached(file)
+    except FileNotFoundError:
+        return b""
 
 def create_repo(token, name, desc, private):
-    r = requests.post(
+    r = get_github_session(token).post(
         "https://api.github.com/user/repos",
-        headers={
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
-        },
-        json={
+        data=encode_json({
             "name": name,
             "description": desc,
             "private": private,
             "auto_init": True
-        }
+        })
     )
     return r
 
-def upload_file(token, owner, repo, path, content, msg):
-    return requests.put(
-        f"https://api.github.com/repos/{owner}/{repo}/contents/{path}",
-        headers={
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
-        },
-        json={
-            "message": msg,
-            "content": base64.b64encode(content.encode()).decode()
-        }
+def encode_content(content):
+    """Base64-encode file bytes for the GitHub API"""
+    return base64.b64encode(content).decode("ascii")
+
+def encode_json(data):
+    """Serialize a request body to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def gh_headers(token):
+    return {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+        "Content-Type": "application/json"
+    }
+
+@st.cache_resource
+def get_github_session(token):
+    """Pooled GitHub API session, reused across calls and upload threads"""
+    s = requests.Session()
+    s.headers.update(gh_headers(token))
+    s.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    ))
+    return s
+
+def create_blob(token, owner, repo, content):
+    r = get_github_session(token).post(
+        f"https://api.github.com/repos/{owner}/{repo}/git/blobs",
+        data=encode_json({
+            "content": encode_content(content),
+            "encoding": "base64"
+        })
     )
+    r.raise_for_status()
+    return decode_json(r)["sha"]
+
+def get_branch_head(token, owner, repo, branch):
+    """Return (head commit sha, head tree sha) for a branch"""
+    api = f"https://api.github.com/repos/{owner}/{repo}/git"
+    s = get_github_session(token)
+
+    r = s.get(f"{api}/ref/heads/{branch}")
+    r.raise_for_status()
+    head_sha = decode_json(r)["object"]["sha"]
+
+    r = s.get(f"{api}/commits/{head_sha}")
+    r.raise_for_status()
+    return head_sha, decode_json(r)["tree"]["sha"]
+
+def upload_files_batch(token, owner, repo, files, msg, branch="main"):
+    """Commit all files in one commit via the Git Data API"""
+    api = f"https://api.github.com/repos/{owner}/{repo}/git"
+    s = get_github_session(token)
+
+    # The branch head lookup and the blob uploads don't depend on each other
+    paths = list(files)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        head = ex.submit(get_branch_head, token, owner, repo, branch)
+        shas = list(ex.map(lambda p: create_blob(token, owner, repo, files[p]), paths))
+        head_sha, base_tree = head.result()
+
+    r = s.post(
+        f"{api}/trees",
+        data=encode_json({
+            "base_tree": base_tree,
+            "tree": [
+                {"path": p, "mode": "100644", "type": "blob", "sha": sha}
+                for p, sha in zip(paths, shas)
+            ]
+        })
+    )
+    r.raise_for_status()
+
+    r = s.post(
+        f"{api}/commits",
+        data=encode_json({"message": msg, "tree": decode_json(r)["sha"], "parents": [head_sha]})
+    )
+    r.raise_for_status()
+
+    r = s.patch(f"{api}/refs/heads/{branch}", data=encode_json({"sha": decode_json(r)["sha"]}))
+    r.raise_for_status()
+    return r
 
 # ===============================
 # MAIN APP
 # ===============================
 def main():
+    inject_css()
+
     st.markdown("""
     <div class="main-header">
         <h1>🚀 GitHub → Streamlit Deployer</h1>
@@ -147,29 +240,37 @@ def main():
 
         if st.button("🚀 Create Repo & Deploy", type="primary"):
             if not token:
-                st.markdown("<div class='error'>GitHub token required</div>", unsafe_allow_html=True)
+                st.error("GitHub token required")
                 return
 
             with st.spinner("Creating repository..."):
                 res = create_repo(token, repo_name, repo_desc, private)
 
             if res.status_code != 201:
-                st.markdown(f"<div class='error'>{res.json().get('message')}</div>", unsafe_allow_html=True)
+                st.error(decode_json(res).get('message'))
                 return
 
-            data = res.json()
+            data = decode_json(res)
             owner = data["owner"]["login"]
 
-            st.markdown("<div class='success'>Repository Created</div>", unsafe_allow_html=True)
+            st.success("Repository Created")
 
-            files = [
-                ("app.py", read_template(selected_template)),
-                ("requirements.txt", read_file("requirements.txt")),
-                ("packages.txt", read_file("packages.txt")),
-            ]
+            files = {
+                "app.py": read_template(selected_template),
+                "requirements.txt": read_file("requirements.txt"),
+                "packages.txt": read_file("packages.txt"),
+            }
 
-            for f, c in files:
-                upload_file(token, owner, repo_name, f, c, f"Add {f}")
+            try:
+                upload_files_batch(
+                    token, owner, repo_name,
+                    {f: c for f, c in files.items() if c is not None},
+                    f"Add {selected_template} as app.py",
+                    data.get("default_branch", "main")
+                )
+            except requests.RequestException as e:
+                st.error(f"Upload failed: {e}")
+                return
 
             st.success("All files uploaded")
             st.markdown(f"[Open Repository]({data['html_url']})")
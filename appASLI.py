@@ -1,10 +1,19 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import base64
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set page config
 st.set_page_config(
     page_title="GitHub → Streamlit Deployer",
@@ -14,7 +23,7 @@ st.set_page_config(
 )
 
 # Custom CSS for beautiful styling
-st.markdown("""
+_CSS = "".join(line.strip() for line in """
 <style>
     .main-header {
         text-align: center;
@@ -34,22 +43,6 @@ st.markdown("""
         border-left: 4px solid #667eea;
     }
     
-    .success-message {
-        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
-    .error-message {
-        background: linear-gradient(135deg, #f44336 0%, #da190b 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    
     .info-box {
         background: linear-gradient(135deg, #2196F3 0%, #1976D2 100%);
         color: white;
@@ -58,15 +51,95 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+""".splitlines())
+
+def inject_css():
+    """Inject the custom CSS into the page"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+# Upper bound on concurrent GitHub API requests; the connection pool is sized to match
+MAX_CONCURRENT_REQUESTS = 8
+
+# Pause before the next call once the rate limit is almost exhausted, up to this many seconds;
+# kept short because the pause blocks the script run with no feedback in the UI
+RATE_LIMIT_THRESHOLD = 5
+MAX_RATE_LIMIT_WAIT = 10
+
+def wait_for_rate_limit(response, *args, **kwargs):
+    """Sleep until the rate limit resets when only a few requests remain"""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None or int(remaining) >= RATE_LIMIT_THRESHOLD:
+        return
+    wait = int(reset) - time.time()
+    if wait > 0:
+        time.sleep(min(wait, MAX_RATE_LIMIT_WAIT))
+
+@st.cache_resource
+def get_github_session(token, retry_posts=True):
+    """Get a pooled GitHub API session for the given token"""
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+        "Content-Type": "application/json"
+    })
+    
+    # Keep connections alive across calls and back off on rate limiting and gateway errors.
+    # Repository creation must not be retried: a POST that timed out at the gateway may
+    # still have created the repository, and the retry would then fail as a name clash
+    allowed_methods = {"GET", "PUT", "POST", "PATCH"} if retry_posts else {"GET", "PUT", "PATCH"}
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=allowed_methods,
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.hooks["response"].append(wait_for_rate_limit)
+    return session
+
+def encode_json(data):
+    """Serialize a request body to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def generate_repo_from_template(token, template_repo, repo_name, description, private=False):
+    """Create a GitHub repository from a template repository"""
+    url = f"https://api.github.com/repos/{template_repo}/generate"
+    session = get_github_session(token, retry_posts=False)
+    
+    data = {
+        "name": repo_name,
+        "description": description,
+        "private": private
+    }
+    
+    response = session.post(url, data=encode_json(data))
+    return response
+
+def discard_body(response):
+    """Drop an unneeded response body while keeping the connection pooled"""
+    response.raw.drain_conn()
+    response.close()
 
 def create_github_repo(token, repo_name, description, private=False):
     """Create a GitHub repository"""
     url = "https://api.github.com/user/repos"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+    session = get_github_session(token, retry_posts=False)
     
     data = {
         "name": repo_name,
@@ -75,34 +148,109 @@ def create_github_repo(token, repo_name, description, private=False):
         "auto_init": True
     }
     
-    response = requests.post(url, headers=headers, json=data)
+    response = session.post(url, data=encode_json(data))
     return response
 
-def upload_file_to_repo(token, owner, repo, file_path, content, message="Add file"):
-    """Upload a file to GitHub repository"""
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+def encode_content(content):
+    """Encode raw file bytes to base64 for the GitHub API"""
+    return base64.b64encode(content).decode("ascii")
+
+def create_blob(token, owner, repo, content_b64):
+    """Create a Git blob and return its SHA"""
+    url = f"https://api.github.com/repos/{owner}/{repo}/git/blobs"
+    session = get_github_session(token)
     
-    # Encode content to base64
-    content_b64 = base64.b64encode(content.encode()).decode()
+    response = session.post(url, data=encode_json({"content": content_b64, "encoding": "base64"}))
+    response.raise_for_status()
+    return decode_json(response)["sha"]
+
+# A repository generated from a template is filled in asynchronously, so its branch
+# can 404/409 for a while; poll it this many times with doubling waits (about 23s in all)
+BRANCH_READY_ATTEMPTS = 6
+MAX_BRANCH_READY_WAIT = 8
+
+def get_branch_head(token, owner, repo, branch, wait_for_branch=False):
+    """Get the head commit SHA and tree SHA of a branch, optionally waiting for it to exist"""
+    api = f"https://api.github.com/repos/{owner}/{repo}/git"
+    session = get_github_session(token)
     
-    data = {
+    attempts = BRANCH_READY_ATTEMPTS if wait_for_branch else 1
+    for attempt in range(attempts):
+        ref_response = session.get(f"{api}/ref/heads/{branch}")
+        if ref_response.status_code not in (404, 409) or attempt == attempts - 1:
+            break
+        discard_body(ref_response)
+        time.sleep(min(2 ** attempt, MAX_BRANCH_READY_WAIT))
+    ref_response.raise_for_status()
+    head_sha = decode_json(ref_response)["object"]["sha"]
+    
+    commit_response = session.get(f"{api}/commits/{head_sha}")
+    commit_response.raise_for_status()
+    return head_sha, decode_json(commit_response)["tree"]["sha"]
+
+def create_tree_commit(token, owner, repo, branch, files, message, wait_for_branch=False):
+    """Commit several base64-encoded files to a branch as a single commit"""
+    api = f"https://api.github.com/repos/{owner}/{repo}/git"
+    session = get_github_session(token)
+    
+    # A repository still being filled from its template rejects blobs too, so wait for its
+    # branch before uploading; otherwise the head lookup and the blobs run concurrently
+    blob_shas = {}
+    with ThreadPoolExecutor(max_workers=min(len(files) + 1, MAX_CONCURRENT_REQUESTS)) as executor:
+        head_future = executor.submit(get_branch_head, token, owner, repo, branch, wait_for_branch)
+        if wait_for_branch:
+            head_future.result()
+        futures = {
+            executor.submit(create_blob, token, owner, repo, content_b64): file_path
+            for file_path, content_b64 in files
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            blob_shas[file_path] = future.result()
+        head_sha, head_tree_sha = head_future.result()
+    
+    # Build the new tree, commit it and move the branch
+    tree_response = session.post(f"{api}/trees", data=encode_json({
+        "base_tree": head_tree_sha,
+        "tree": [
+            {"path": file_path, "mode": "100644", "type": "blob", "sha": blob_shas[file_path]}
+            for file_path, _ in files
+        ]
+    }))
+    tree_response.raise_for_status()
+    
+    new_commit_response = session.post(f"{api}/commits", data=encode_json({
         "message": message,
-        "content": content_b64
-    }
+        "tree": decode_json(tree_response)["sha"],
+        "parents": [head_sha]
+    }))
+    new_commit_response.raise_for_status()
+    new_commit_sha = decode_json(new_commit_response)["sha"]
     
-    response = requests.put(url, headers=headers, json=data)
-    return response
+    update_response = session.patch(f"{api}/refs/heads/{branch}", data=encode_json({"sha": new_commit_sha}), stream=True)
+    try:
+        update_response.raise_for_status()
+    finally:
+        discard_body(update_response)
+    return new_commit_sha
+
+_PACKAGES = b"ffmpeg\n"
+
+@st.cache_data(show_spinner=False)
+def read_file_bytes(path, mtime_ns):
+    """Read a file as bytes, cached until its modification time changes"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def read_file_cached(path):
+    """Read a file through the mtime-keyed cache"""
+    return read_file_bytes(path, os.stat(path).st_mtime_ns)
 
 def get_streamlit_app_template():
     """Get a template Streamlit app"""
     """Read template from template-app4.py file"""
     try:
-        with open('template-app4.py', 'r', encoding='utf-8') as f:
-            return f.read()
+        return read_file_cached('template-app4.py')
     except FileNotFoundError:
         st.error("❌ template-app4.py file not found!")
         return None
@@ -113,8 +261,7 @@ def get_streamlit_app_template():
 def get_requirements_txt():
     """Get requirements.txt content"""
     try:
-        with open('requirements.txt', 'r', encoding='utf-8') as f:
-            return f.read()
+        return read_file_cached('requirements.txt')
     except FileNotFoundError:
         st.error("❌ requirements.txt file not found!")
         return None
@@ -124,11 +271,9 @@ def get_requirements_txt():
 
 def get_packages_txt():
     """Get packages.txt content for system dependencies"""
-    return """ffmpeg
-"""
-def get_readme_content(repo_name):
-    """Get README.md content"""
-    return f"""# {repo_name}
+    return _PACKAGES
+
+_README_TEMPLATE = """# {repo_name}
 
 A beautiful Streamlit application automatically deployed from GitHub.
 
@@ -174,8 +319,34 @@ Feel free to submit issues and enhancement requests!
 This project is licensed under the MIT License.
 """
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_readme_content(repo_name):
+    """Get README.md content as UTF-8 bytes"""
+    return _README_TEMPLATE.format(repo_name=repo_name).encode("utf-8")
+
+# (path, commit message line) for each file pushed to a new repository
+_UPLOAD_PLAN = (
+    ("app.py", "Add YouTube Live Streaming app"),
+    ("requirements.txt", "Add requirements"),
+    ("packages.txt", "Add system packages"),
+    ("README.md", "Add README"),
+)
+# A template repository already ships everything but the README
+_TEMPLATE_UPLOAD_PLAN = (
+    ("README.md", "Add README"),
+)
+# Content getters by path, only called once a deploy is requested; the README is built
+# per repository, so main() renders it separately
+_UPLOAD_SOURCES = {
+    "app.py": get_streamlit_app_template,
+    "requirements.txt": get_requirements_txt,
+    "packages.txt": get_packages_txt,
+}
+
 # Main app
 def main():
+    inject_css()
+    
     st.markdown("""
     <div class="main-header">
         <h1>🚀 GitHub → Streamlit Deployer</h1>
@@ -201,6 +372,11 @@ def main():
         "A beautiful Streamlit application with auto-deployment"
     )
     private_repo = st.sidebar.checkbox("Private Repository", False)
+    template_repo = st.sidebar.text_input(
+        "Template Repository (optional)",
+        "",
+        help="owner/name of a GitHub template repository that already contains app.py, requirements.txt and packages.txt"
+    ).strip()
     
     # Main content
     col1, col2 = st.columns([2, 1])
@@ -221,61 +397,76 @@ def main():
         
         if st.button("🚀 Create Repository & Deploy", type="primary"):
             if not github_token:
-                st.markdown("""
-                <div class="error-message">
-                    ❌ Please provide a GitHub Personal Access Token
-                </div>
-                """, unsafe_allow_html=True)
+                st.error("❌ Please provide a GitHub Personal Access Token")
                 return
             
             if not repo_name:
-                st.markdown("""
-                <div class="error-message">
-                    ❌ Please provide a repository name
-                </div>
-                """, unsafe_allow_html=True)
+                st.error("❌ Please provide a repository name")
                 return
             
             with st.spinner("Creating repository..."):
-                # Create repository
-                response = create_github_repo(
-                    github_token, 
-                    repo_name, 
-                    repo_description, 
-                    private_repo
-                )
+                # Create repository, from the template repository when one is given
+                try:
+                    if template_repo:
+                        response = generate_repo_from_template(
+                            github_token,
+                            template_repo,
+                            repo_name,
+                            repo_description,
+                            private_repo
+                        )
+                    else:
+                        response = create_github_repo(
+                            github_token, 
+                            repo_name, 
+                            repo_description, 
+                            private_repo
+                        )
+                except requests.RequestException as e:
+                    # Includes RetryError once the rate-limit/gateway retries run out
+                    st.error(f"❌ Failed to create repository: {e}")
+                    return
                 
                 if response.status_code == 201:
-                    repo_data = response.json()
+                    repo_data = decode_json(response)
                     owner = repo_data['owner']['login']
                     
-                    st.markdown("""
-                    <div class="success-message">
-                        ✅ Repository created successfully!
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.success("✅ Repository created successfully!")
                     
-                    # Upload files
-                    files_to_upload = [
-                        ("app.py", get_streamlit_app_template(), "Add YouTube Live Streaming app"),
-                        ("requirements.txt", get_requirements_txt(), "Add requirements"),
-                        ("packages.txt", get_packages_txt(), "Add system packages"),
-                        ("README.md", get_readme_content(repo_name), "Add README")
-                    ]
+                    # Encode each file once, before any upload is attempted
+                    files_to_upload = []
+                    for file_path, message in (_TEMPLATE_UPLOAD_PLAN if template_repo else _UPLOAD_PLAN):
+                        if file_path == "README.md":
+                            content = get_readme_content(repo_name)
+                        else:
+                            content = _UPLOAD_SOURCES[file_path]()
+                        if content is not None:
+                            files_to_upload.append((file_path, encode_content(content), message))
                     
                     progress_bar = st.progress(0)
+                    upload_status = st.empty()
                     
-                    for i, (file_path, content, message) in enumerate(files_to_upload):
-                        upload_response = upload_file_to_repo(
-                            github_token, owner, repo_name, file_path, content, message
+                    # Commit all files at once through the Git Data API
+                    commit_message = "Deploy Streamlit app\n\n" + "\n".join(
+                        f"- {message}" for _, _, message in files_to_upload
+                    )
+                    try:
+                        create_tree_commit(
+                            github_token,
+                            owner,
+                            repo_name,
+                            repo_data.get('default_branch', 'main'),
+                            [(file_path, content_b64) for file_path, content_b64, _ in files_to_upload],
+                            commit_message,
+                            wait_for_branch=bool(template_repo)
                         )
-                        
-                        if upload_response.status_code in [201, 200]:
-                            st.success(f"✅ {file_path} uploaded successfully")
-                        else:
-                            st.error(f"❌ Failed to upload {file_path}")
-                        
-                        progress_bar.progress((i + 1) / len(files_to_upload))
+                        # Report every file in a single element instead of one per file
+                        upload_status.success("  \n".join(
+                            f"✅ {file_path} uploaded successfully" for file_path, _, _ in files_to_upload
+                        ))
+                        progress_bar.progress(1.0)
+                    except requests.RequestException as e:
+                        upload_status.error(f"❌ Failed to upload files: {e}")
                     
                     # Display repository info
                     st.markdown(f"""
@@ -303,12 +494,8 @@ def main():
                     """, unsafe_allow_html=True)
                     
                 else:
-                    error_message = response.json().get('message', 'Unknown error')
-                    st.markdown(f"""
-                    <div class="error-message">
-                        ❌ Failed to create repository: {error_message}
-                    </div>
-                    """, unsafe_allow_html=True)
+                    error_message = decode_json(response).get('message', 'Unknown error')
+                    st.error(f"❌ Failed to create repository: {error_message}")
     
     with col2:
         st.markdown("""
@@ -1,46 +1,129 @@
 #!/usr/bin/env python3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import json
 import base64
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def encode_json(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
 
 def get_templates():
-    return sorted([
-        f for f in os.listdir(".")
-        if f.startswith("template-app") and f.endswith(".py")
-    ])
+    with os.scandir(".") as entries:
+        return sorted(
+            e.name for e in entries
+            if e.name.startswith("template-app") and e.name.endswith(".py") and e.is_file()
+        )
+
+# A freshly created repo can 404/409 on its ref for a few seconds; poll this many times
+HEAD_ATTEMPTS = 5
 
 class Deployer:
     def __init__(self, token):
         self.h = {
             "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json"
+            "Accept": "application/vnd.github.v3+json",
+            "X-GitHub-Api-Version": "2022-11-28"
         }
+        self.s = requests.Session()
+        self.s.headers.update(self.h)
+        self.s.headers["Content-Type"] = "application/json"
+        self.s.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET", "POST", "PATCH"],
+                respect_retry_after_header=True
+            )
+        ))
+        # Don't retry repo creation: a timed-out POST may have created it already
+        self.s.mount("https://api.github.com/user/repos", HTTPAdapter(
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=True
+            )
+        ))
 
     def create_repo(self, name, desc, private):
-        r = requests.post(
+        r = self.s.post(
             "https://api.github.com/user/repos",
-            headers=self.h,
-            json={
+            data=encode_json({
                 "name": name,
                 "description": desc,
                 "private": private,
                 "auto_init": True
-            }
+            })
         )
+        body = r.json()
         if r.status_code != 201:
-            raise Exception(r.json())
-        return r.json()
-
-    def upload(self, owner, repo, path, content):
-        requests.put(
-            f"https://api.github.com/repos/{owner}/{repo}/contents/{path}",
-            headers=self.h,
-            json={
-                "message": f"Add {path}",
-                "content": base64.b64encode(content.encode()).decode()
-            }
+            raise Exception(f"{r.status_code}: {body.get('message', '?')}")
+        return body
+
+    def blob(self, owner, repo, content):
+        r = self.s.post(
+            f"https://api.github.com/repos/{owner}/{repo}/git/blobs",
+            data=b'{"encoding":"base64","content":"' + base64.b64encode(content) + b'"}'
         )
+        r.raise_for_status()
+        return r.json()["sha"]
+
+    def head(self, owner, repo, branch):
+        api = f"https://api.github.com/repos/{owner}/{repo}/git"
+        for attempt in range(HEAD_ATTEMPTS):
+            r = self.s.get(f"{api}/ref/heads/{branch}")
+            if r.status_code not in (404, 409) or attempt == HEAD_ATTEMPTS - 1:
+                break
+            r.close()
+            time.sleep(2 ** attempt)
+        r.raise_for_status()
+        sha = r.json()["object"]["sha"]
+        r = self.s.get(f"{api}/commits/{sha}")
+        r.raise_for_status()
+        return sha, r.json()["tree"]["sha"]
+
+    def commit(self, owner, repo, files, message, branch="main"):
+        api = f"https://api.github.com/repos/{owner}/{repo}/git"
+        paths = list(files)
+        # Blobs are rejected until the new repo is ready, so wait for its head first
+        parent, base_tree = self.head(owner, repo, branch)
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            shas = list(ex.map(lambda p: self.blob(owner, repo, files[p]), paths))
+
+        r = self.s.post(f"{api}/trees", data=encode_json({
+            "base_tree": base_tree,
+            "tree": [
+                {"path": p, "mode": "100644", "type": "blob", "sha": sha}
+                for p, sha in zip(paths, shas)
+            ]
+        }))
+        r.raise_for_status()
+        r = self.s.post(f"{api}/commits", data=encode_json({
+            "message": message,
+            "tree": r.json()["sha"],
+            "parents": [parent]
+        }))
+        r.raise_for_status()
+        sha = r.json()["sha"]
+        r = self.s.patch(f"{api}/refs/heads/{branch}", data=encode_json({"sha": sha}))
+        r.raise_for_status()
+        return sha
 
 def main():
     p = argparse.ArgumentParser()
@@ -59,10 +142,10 @@ def main():
         "template-app4.py" if "template-app4.py" in templates else templates[0]
     )
 
-    with open(template, "r", encoding="utf-8") as f:
+    with open(template, "rb") as f:
         app_code = f.read()
 
-    with open("requirements.txt", "r", encoding="utf-8") as f:
+    with open("requirements.txt", "rb") as f:
         req = f.read()
 
     deployer = Deployer(args.token)
@@ -70,8 +153,12 @@ def main():
 
     owner = repo["owner"]["login"]
 
-    deployer.upload(owner, args.repo, "app.py", app_code)
-    deployer.upload(owner, args.repo, "requirements.txt", req)
+    deployer.commit(
+        owner, args.repo,
+        {"app.py": app_code, "requirements.txt": req},
+        f"Add {template} as app.py",
+        repo.get("default_branch", "main")
+    )
 
     print("✅ DONE")
     print(repo["html_url"])
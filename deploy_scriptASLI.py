@@ -13,112 +13,42 @@ Author: GitHub → Streamlit Deployer
 Version: 1.0.0
 """
 
-import requests
 import json
+import logging
 import os
-import base64
+import sys
 import argparse
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
-class GitHubStreamlitDeployer:
-    """Main class for handling GitHub repository creation and Streamlit deployment setup."""
-    
-    def __init__(self, github_token: str):
-        """Initialize the deployer with GitHub token."""
-        self.github_token = github_token
-        self.github_headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
-    
-    def create_repository(self, name: str, description: str = "", private: bool = False) -> Dict[str, Any]:
-        """
-        Create a new GitHub repository.
-        
-        Args:
-            name: Repository name
-            description: Repository description
-            private: Whether the repository should be private
-            
-        Returns:
-            Dictionary containing repository information
-        """
-        url = "https://api.github.com/user/repos"
-        
-        data = {
-            "name": name,
-            "description": description,
-            "private": private,
-            "auto_init": True
-        }
-        
-        response = requests.post(url, headers=self.github_headers, json=data)
-        
-        if response.status_code == 201:
-            return response.json()
-        else:
-            raise Exception(f"Failed to create repository: {response.json()}")
-    
-    def upload_file(self, owner: str, repo: str, file_path: str, content: str, message: str = "Add file") -> bool:
-        """
-        Upload a file to the GitHub repository.
-        
-        Args:
-            owner: Repository owner
-            repo: Repository name
-            file_path: Path where the file should be created
-            content: File content
-            message: Commit message
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-        
-        content_b64 = base64.b64encode(content.encode()).decode()
-        
-        data = {
-            "message": message,
-            "content": content_b64
-        }
-        
-        response = requests.put(url, headers=self.github_headers, json=data)
-        return response.status_code in [201, 200]
-    
-    def get_streamlit_app_template(self) -> str:
-        """Generate a comprehensive Streamlit app template."""
-        """Read template from template-app4.py file"""
-        try:
-            with open('template-app4.py', 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            print("❌ template-app4.py file not found!")
-            return None
-        except Exception as e:
-            print(f"❌ Error reading template-app4.py: {e}")
-            return None
-    
-    def get_requirements_txt(self) -> str:
-        """Generate requirements.txt content."""
-        try:
-            with open('requirements.txt', 'r', encoding='utf-8') as f:
-                return f.read()
-        except FileNotFoundError:
-            print("❌ requirements.txt file not found!")
-            return None
-        except Exception as e:
-            print(f"❌ Error reading requirements.txt: {e}")
-            return None
-    
-    def get_packages_txt(self) -> str:
-        """Generate packages.txt content for system dependencies"""
-        return """ffmpeg
+logger = logging.getLogger(__name__)
+
+_PACKAGES_TXT = """ffmpeg
 """
-    
-    def get_readme_content(self, repo_name: str) -> str:
-        """Generate README.md content."""
-        return f"""# {repo_name}
+
+@functools.lru_cache(maxsize=None)
+def _read_text_file(path: str) -> str:
+    """Read a UTF-8 text file once per process; errors are raised and not cached."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def _json_dumps():
+    """Pick the JSON serializer on first use, so the CLI doesn't import orjson until it sends a request."""
+    try:
+        import orjson
+        return orjson.dumps
+    except ImportError:
+        return lambda data: json.dumps(data).encode('utf-8')
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when available."""
+    return _json_dumps()(data)
+
+_README_TEMPLATE = """# {repo_name}
 
 🚀 **Auto-deployed Streamlit Application**
 
@@ -265,8 +195,233 @@ This project is licensed under the MIT License - see the LICENSE file for detail
 
 **Happy analyzing!** 🎉
 
-*Auto-generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
 """
+
+# Appended per render, so the cached body above stays keyed on the repository name alone
+_README_FOOTER = "*Auto-generated on {timestamp}*\n"
+
+# Upper bound on repositories deployed at once from the CLI
+MAX_CONCURRENT_DEPLOYS = 4
+
+# Concurrent requests per deploy while its blobs are uploaded
+BLOB_UPLOAD_WORKERS = 8
+
+# A freshly created repository can answer 404/409 on its branch for a few seconds,
+# so the head lookup is retried this many times with doubling waits
+BRANCH_READY_ATTEMPTS = 5
+
+@functools.lru_cache(maxsize=128)
+def _build_readme_body(repo_name: str) -> str:
+    """Render the timestamp-free part of the README for a repository."""
+    return _README_TEMPLATE.format(repo_name=repo_name)
+
+class RepositoryExistsError(Exception):
+    """Raised when the repository to create already exists on the account."""
+
+class GitHubStreamlitDeployer:
+    """Main class for handling GitHub repository creation and Streamlit deployment setup."""
+    
+    def __init__(self, github_token: str):
+        """Initialize the deployer with GitHub token."""
+        self.github_token = github_token
+        self.github_headers = {
+            "Authorization": f"token {github_token}",
+            "Accept": "application/vnd.github.v3+json",
+            "X-GitHub-Api-Version": "2022-11-28"
+        }
+        # Imported here so `--help` and argument errors don't pay for loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # One pooled session so every API call reuses the same keep-alive connection
+        self.session = requests.Session()
+        self.session.headers.update(self.github_headers)
+        self.session.headers["Content-Type"] = "application/json"
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            # Enough connections for every in-flight request of a full batch, so none are discarded
+            pool_maxsize=MAX_CONCURRENT_DEPLOYS * BLOB_UPLOAD_WORKERS,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET", "POST", "PATCH"],
+                respect_retry_after_header=True
+            )
+        ))
+        # Repository creation is not retried: a POST that timed out at the gateway may still
+        # have created the repository, and the retry would then fail as a name clash
+        self.session.mount("https://api.github.com/user/repos", HTTPAdapter(
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=True
+            )
+        ))
+    
+    def create_repository(self, name: str, description: str = "", private: bool = False) -> Dict[str, Any]:
+        """
+        Create a new GitHub repository.
+        
+        Args:
+            name: Repository name
+            description: Repository description
+            private: Whether the repository should be private
+            
+        Returns:
+            Dictionary containing repository information
+        """
+        url = "https://api.github.com/user/repos"
+        
+        data = {
+            "name": name,
+            "description": description,
+            "private": private,
+            "auto_init": True
+        }
+        
+        response = self.session.post(url, data=_encode_json(data))
+        
+        if response.status_code == 201:
+            return response.json()
+        
+        if response.status_code == 401:
+            raise Exception("GitHub token is invalid or expired")
+        
+        error = response.json()
+        # A name clash comes back as a 422 validation error on the `name` field
+        if response.status_code == 422 and any(e.get('field') == 'name' for e in error.get('errors', [])):
+            raise RepositoryExistsError(f"Repository '{name}' already exists")
+        raise Exception(f"Failed to create repository: {response.status_code} {error.get('message', 'Unknown error')}")
+    
+    def create_blob(self, owner: str, repo: str, content: str) -> str:
+        """
+        Create a Git blob in the repository.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            content: File content
+            
+        Returns:
+            SHA of the created blob
+        """
+        url = f"https://api.github.com/repos/{owner}/{repo}/git/blobs"
+        
+        # Text blobs can be sent as-is, without base64's size and CPU overhead
+        data = {
+            "content": content,
+            "encoding": "utf-8"
+        }
+        
+        response = self.session.post(url, data=_encode_json(data))
+        response.raise_for_status()
+        return response.json()["sha"]
+    
+    def get_branch_head(self, owner: str, repo: str, branch: str) -> Tuple[str, str]:
+        """
+        Look up the head of a branch.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+            
+        Returns:
+            Tuple of (head commit SHA, head tree SHA)
+        """
+        api = f"https://api.github.com/repos/{owner}/{repo}/git"
+        
+        for attempt in range(BRANCH_READY_ATTEMPTS):
+            response = self.session.get(f"{api}/ref/heads/{branch}")
+            if response.status_code not in (404, 409) or attempt == BRANCH_READY_ATTEMPTS - 1:
+                break
+            response.close()
+            time.sleep(2 ** attempt)
+        response.raise_for_status()
+        head_sha = response.json()["object"]["sha"]
+        
+        response = self.session.get(f"{api}/commits/{head_sha}")
+        response.raise_for_status()
+        return head_sha, response.json()["tree"]["sha"]
+    
+    def commit_files(self, owner: str, repo: str, files: List[Tuple[str, str]], message: str, branch: str = "main") -> str:
+        """
+        Commit several files to a branch in a single commit via the Git Data API.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            files: List of (file path, file content) pairs
+            message: Commit message
+            branch: Branch to commit to
+            
+        Returns:
+            SHA of the new commit
+        """
+        api = f"https://api.github.com/repos/{owner}/{repo}/git"
+        
+        # The repository rejects blobs until it is ready, so wait for the branch head first;
+        # the blobs are independent of each other, so create them in parallel
+        head_sha, base_tree = self.get_branch_head(owner, repo, branch)
+        with ThreadPoolExecutor(max_workers=BLOB_UPLOAD_WORKERS) as executor:
+            blob_shas = list(executor.map(lambda f: self.create_blob(owner, repo, f[1]), files))
+        
+        response = self.session.post(f"{api}/trees", data=_encode_json({
+            "base_tree": base_tree,
+            "tree": [
+                {"path": file_path, "mode": "100644", "type": "blob", "sha": sha}
+                for (file_path, _), sha in zip(files, blob_shas)
+            ]
+        }))
+        response.raise_for_status()
+        
+        response = self.session.post(f"{api}/commits", data=_encode_json({
+            "message": message,
+            "tree": response.json()["sha"],
+            "parents": [head_sha]
+        }))
+        response.raise_for_status()
+        commit_sha = response.json()["sha"]
+        
+        response = self.session.patch(f"{api}/refs/heads/{branch}", data=_encode_json({"sha": commit_sha}))
+        response.raise_for_status()
+        return commit_sha
+    
+    def get_streamlit_app_template(self) -> str:
+        """Generate a comprehensive Streamlit app template."""
+        """Read template from template-app4.py file"""
+        try:
+            return _read_text_file('template-app4.py')
+        except FileNotFoundError:
+            logger.error("❌ template-app4.py file not found!")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Error reading template-app4.py: {e}")
+            return None
+    
+    def get_requirements_txt(self) -> str:
+        """Generate requirements.txt content."""
+        try:
+            return _read_text_file('requirements.txt')
+        except FileNotFoundError:
+            logger.error("❌ requirements.txt file not found!")
+            return None
+        except Exception as e:
+            logger.error(f"❌ Error reading requirements.txt: {e}")
+            return None
+    
+    def get_packages_txt(self) -> str:
+        """Generate packages.txt content for system dependencies"""
+        return _PACKAGES_TXT
+    
+    def get_readme_content(self, repo_name: str, timestamp: Optional[str] = None) -> str:
+        """Generate README.md content, stamped with `timestamp` or the current time."""
+        timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _build_readme_body(repo_name) + _README_FOOTER.format(timestamp=timestamp)
     
     def deploy_complete_app(self, repo_name: str, description: str = "", private: bool = False) -> Dict[str, Any]:
         """
@@ -280,30 +435,45 @@ This project is licensed under the MIT License - see the LICENSE file for detail
         Returns:
             Dictionary containing deployment information
         """
-        print(f"🚀 Creating repository: {repo_name}")
+        import requests
+        
+        logger.info(f"🚀 Creating repository: {repo_name}")
+        deployed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Read the local files up front; they are cached after the first deploy
+        template = self.get_streamlit_app_template()
+        requirements = self.get_requirements_txt()
         
         # Create repository
         repo_info = self.create_repository(repo_name, description, private)
         owner = repo_info['owner']['login']
         
-        print(f"✅ Repository created: {repo_info['html_url']}")
+        logger.info(f"✅ Repository created: {repo_info['html_url']}")
         
         # Files to upload
         files = [
-            ("app.py", self.get_streamlit_app_template(), "Add YouTube Live Streaming application"),
-            ("requirements.txt", self.get_requirements_txt(), "Add Python dependencies"),
+            ("app.py", template, "Add YouTube Live Streaming application"),
+            ("requirements.txt", requirements, "Add Python dependencies"),
             ("packages.txt", self.get_packages_txt(), "Add system packages"),
-            ("README.md", self.get_readme_content(repo_name), "Add detailed documentation")
+            ("README.md", self.get_readme_content(repo_name, deployed_at), "Add detailed documentation")
         ]
         
-        # Upload files
-        for file_path, content, message in files:
-            print(f"📤 Uploading {file_path}...")
-            success = self.upload_file(owner, repo_name, file_path, content, message)
-            if success:
-                print(f"✅ {file_path} uploaded successfully")
-            else:
-                print(f"❌ Failed to upload {file_path}")
+        files = [(file_path, content, message) for file_path, content, message in files if content is not None]
+        
+        # Upload all files in a single commit
+        logger.info(f"📤 Uploading {', '.join(file_path for file_path, _, _ in files)} to {repo_name}...")
+        try:
+            self.commit_files(
+                owner,
+                repo_name,
+                [(file_path, content) for file_path, content, _ in files],
+                "Deploy Streamlit app\n\n" + "\n".join(f"- {message}" for _, _, message in files),
+                repo_info.get('default_branch', 'main')
+            )
+            for file_path, _, _ in files:
+                logger.info(f"✅ {repo_name}/{file_path} uploaded successfully")
+        except requests.RequestException as e:
+            logger.error(f"❌ Failed to upload files to {repo_name}: {e}")
         
         deployment_info = {
             'repository': repo_info,
@@ -311,6 +481,7 @@ This project is licensed under the MIT License - see the LICENSE file for detail
             'repo_name': repo_name,
             'clone_url': repo_info['clone_url'],
             'html_url': repo_info['html_url'],
+            'deployed_at': deployed_at,
             'streamlit_instructions': {
                 'url': 'https://share.streamlit.io/',
                 'steps': [
@@ -329,26 +500,43 @@ def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(description="GitHub → Streamlit Cloud Auto-Deployer")
     parser.add_argument("--token", required=True, help="GitHub Personal Access Token")
-    parser.add_argument("--repo", required=True, help="Repository name")
+    parser.add_argument("--repo", required=True, nargs="+", help="Repository name (several names deploy concurrently)")
     parser.add_argument("--description", default="Auto-deployed Streamlit application", help="Repository description")
     parser.add_argument("--private", action="store_true", help="Create private repository")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     
     try:
         deployer = GitHubStreamlitDeployer(args.token)
-        result = deployer.deploy_complete_app(args.repo, args.description, args.private)
-        
-        print("\n🎉 Deployment Complete!")
-        print(f"📁 Repository: {result['html_url']}")
-        print(f"🔗 Clone URL: {result['clone_url']}")
-        print("\n🚀 Next Steps:")
-        print("1. Go to https://share.streamlit.io/")
-        print("2. Click 'New app'")
-        print("3. Select your repository")
-        print("4. Set main file path: app.py")
-        print("5. Click 'Deploy!'")
-        print("\n✨ Your app will be live in minutes!")
+        
+        # Repositories are independent, so deploy them side by side over the shared session
+        with ThreadPoolExecutor(max_workers=min(len(args.repo), MAX_CONCURRENT_DEPLOYS)) as executor:
+            deploys = [
+                (repo, executor.submit(deployer.deploy_complete_app, repo, args.description, args.private))
+                for repo in args.repo
+            ]
+        
+        deployed = 0
+        for repo, deploy in deploys:
+            try:
+                result = deploy.result()
+            except Exception as e:
+                print(f"❌ Error deploying {repo}: {e}")
+                continue
+            deployed += 1
+            print("\n🎉 Deployment Complete!")
+            print(f"📁 Repository: {result['html_url']}")
+            print(f"🔗 Clone URL: {result['clone_url']}")
+        
+        if deployed:
+            print("\n🚀 Next Steps:")
+            print("1. Go to https://share.streamlit.io/")
+            print("2. Click 'New app'")
+            print("3. Select your repository")
+            print("4. Set main file path: app.py")
+            print("5. Click 'Deploy!'")
+            print("\n✨ Your app will be live in minutes!")
         
     except Exception as e:
         print(f"❌ Error: {e}")
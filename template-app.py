@@ -4,13 +4,30 @@ import threading
 import time
 import os
 import json
+import logging
+import queue
+import shutil
+from collections import deque
+from contextlib import nullcontext
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import streamlit.components.v1 as components
 from datetime import datetime, timedelta
 import urllib.parse
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sqlite3
+import pandas as pd
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Install required packages
 try:
     import streamlit as st
@@ -30,220 +47,408 @@ except ImportError:
     from googleapiclient.discovery import build
     from google_auth_oauthlib.flow import Flow
 
+@st.cache_resource
+def get_http_session():
+    """Get a pooled HTTP session shared by all OAuth calls"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    ))
+    atexit.register(session.close)
+    # Open the TLS connection to the token endpoint ahead of the first OAuth exchange
+    threading.Thread(target=warm_http_session, args=(session,), daemon=True).start()
+    return session
+
+def warm_http_session(session):
+    """Make a throwaway request so a pooled connection is ready for the first real call"""
+    try:
+        session.head("https://oauth2.googleapis.com/", timeout=3)
+    except requests.RequestException:
+        pass
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj):
+    """Serialize to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+DB_PATH = Path("streaming_logs.db")
+
+logger = logging.getLogger(__name__)
+
+class DBError(Exception):
+    """Raised by the database helpers; callers decide how to report it"""
+
+def open_db():
+    """Open a SQLite connection to the logging database (WAL mode, autocommit)"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+@st.cache_resource
+def get_db():
+    """Get the SQLite connection shared by the script threads"""
+    return open_db()
+
+@st.cache_resource
+def get_db_lock():
+    """Get the lock serializing access to the shared SQLite connection"""
+    return threading.Lock()
+
 # Initialize database for persistent logs
 def init_database():
     """Initialize SQLite database for persistent logs"""
     try:
-        db_path = Path("streaming_logs.db")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Create logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS streaming_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                session_id TEXT NOT NULL,
-                log_type TEXT NOT NULL,
-                message TEXT NOT NULL,
-                video_file TEXT,
-                stream_key TEXT,
-                channel_name TEXT
-            )
-        ''')
-        
-        # Create streaming_sessions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS streaming_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT UNIQUE NOT NULL,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                video_file TEXT,
-                stream_title TEXT,
-                stream_description TEXT,
-                tags TEXT,
-                category TEXT,
-                privacy_status TEXT,
-                made_for_kids BOOLEAN,
-                channel_name TEXT,
-                status TEXT DEFAULT 'active'
-            )
-        ''')
-        
-        # Create saved_channels table for persistent authentication
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS saved_channels (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                channel_name TEXT UNIQUE NOT NULL,
-                channel_id TEXT NOT NULL,
-                auth_data TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                last_used TEXT NOT NULL
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        st.error(f"Database initialization error: {e}")
+        conn = get_db()
+        with get_db_lock():
+            # Create logs table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS streaming_logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    session_id TEXT NOT NULL,
+                    log_type TEXT NOT NULL,
+                    message TEXT NOT NULL,
+                    video_file TEXT,
+                    stream_key TEXT,
+                    channel_name TEXT
+                )
+            ''')
+            
+            # Create streaming_sessions table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS streaming_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT UNIQUE NOT NULL,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT,
+                    video_file TEXT,
+                    stream_title TEXT,
+                    stream_description TEXT,
+                    tags TEXT,
+                    category TEXT,
+                    privacy_status TEXT,
+                    made_for_kids BOOLEAN,
+                    channel_name TEXT,
+                    status TEXT DEFAULT 'active'
+                )
+            ''')
+            
+            # Create saved_channels table for persistent authentication
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS saved_channels (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    channel_name TEXT UNIQUE NOT NULL,
+                    channel_id TEXT NOT NULL,
+                    auth_data TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_used TEXT NOT NULL
+                )
+            ''')
+            
+            # Indexes for the newest-first log and channel queries
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_logs_session_ts ON streaming_logs(session_id, timestamp DESC)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_logs_ts ON streaming_logs(timestamp DESC)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_logs_type_ts ON streaming_logs(log_type, timestamp DESC)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_channels_last_used ON saved_channels(last_used DESC)')
+    except sqlite3.Error as e:
+        raise DBError(f"Database initialization error: {e}") from e
 
 def save_channel_auth(channel_name, channel_id, auth_data):
     """Save channel authentication data persistently"""
     try:
-        conn = sqlite3.connect("streaming_logs.db")
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO saved_channels 
-            (channel_name, channel_id, auth_data, created_at, last_used)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            channel_name,
-            channel_id,
-            json.dumps(auth_data),
-            datetime.now().isoformat(),
-            datetime.now().isoformat()
-        ))
-        
-        conn.commit()
-        conn.close()
-        return True
-    except Exception as e:
-        st.error(f"Error saving channel auth: {e}")
-        return False
+        with get_db_lock():
+            get_db().execute('''
+                INSERT OR REPLACE INTO saved_channels 
+                (channel_name, channel_id, auth_data, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                channel_name,
+                channel_id,
+                json_dumps(auth_data),
+                datetime.now().isoformat(),
+                datetime.now().isoformat()
+            ))
+        load_saved_channels.clear()
+    except sqlite3.Error as e:
+        raise DBError(f"Error saving channel auth: {e}") from e
+
+@st.cache_resource
+def get_db_write_executor():
+    """Get the single-threaded executor for database writes kept off the script thread"""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+    atexit.register(executor.shutdown)
+    return executor
+
+def save_channel_auth_in_background(channel_name, channel_id, auth_data):
+    """Save channel authentication without blocking the script thread"""
+    def save():
+        try:
+            save_channel_auth(channel_name, channel_id, auth_data)
+        except DBError:
+            logger.exception("Failed to save authentication for channel %s", channel_name)
+    get_db_write_executor().submit(save)
 
+@st.cache_data(ttl=30, show_spinner=False)
 def load_saved_channels():
-    """Load saved channel authentication data"""
+    """Load saved channel authentication data (cached until a channel is saved or used)"""
     try:
-        conn = sqlite3.connect("streaming_logs.db")
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT channel_name, channel_id, auth_data, last_used
-            FROM saved_channels 
-            ORDER BY last_used DESC
-        ''')
+        with get_db_lock():
+            rows = get_db().execute('''
+                SELECT channel_name, channel_id, auth_data, last_used
+                FROM saved_channels 
+                ORDER BY last_used DESC
+            ''').fetchall()
         
         channels = []
-        for row in cursor.fetchall():
+        for row in rows:
             channel_name, channel_id, auth_data, last_used = row
             channels.append({
                 'name': channel_name,
                 'id': channel_id,
-                'auth': json.loads(auth_data),
+                'auth': json_loads(auth_data),
                 'last_used': last_used
             })
         
-        conn.close()
         return channels
-    except Exception as e:
-        st.error(f"Error loading saved channels: {e}")
-        return []
+    except (sqlite3.Error, ValueError) as e:
+        raise DBError(f"Error loading saved channels: {e}") from e
 
 def update_channel_last_used(channel_name):
     """Update last used timestamp for a channel"""
     try:
-        conn = sqlite3.connect("streaming_logs.db")
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE saved_channels 
-            SET last_used = ?
-            WHERE channel_name = ?
-        ''', (datetime.now().isoformat(), channel_name))
-        
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        st.error(f"Error updating channel last used: {e}")
+        with get_db_lock():
+            get_db().execute('''
+                UPDATE saved_channels 
+                SET last_used = ?
+                WHERE channel_name = ?
+            ''', (datetime.now().isoformat(), channel_name))
+        load_saved_channels.clear()
+    except sqlite3.Error as e:
+        raise DBError(f"Error updating channel last used: {e}") from e
 
 def log_to_database(session_id, log_type, message, video_file=None, stream_key=None, channel_name=None):
     """Log message to database"""
     try:
-        conn = sqlite3.connect("streaming_logs.db")
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO streaming_logs 
-            (timestamp, session_id, log_type, message, video_file, stream_key, channel_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            datetime.now().isoformat(),
-            session_id,
-            log_type,
-            message,
-            video_file,
-            stream_key,
-            channel_name
-        ))
-        
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        st.error(f"Error logging to database: {e}")
+        with get_db_lock():
+            get_db().execute('''
+                INSERT INTO streaming_logs 
+                (timestamp, session_id, log_type, message, video_file, stream_key, channel_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                datetime.now().isoformat(),
+                session_id,
+                log_type,
+                message,
+                video_file,
+                stream_key,
+                channel_name
+            ))
+    except sqlite3.Error as e:
+        raise DBError(f"Error logging to database: {e}") from e
+
+def log_many_to_database(rows, conn=None):
+    """Log a batch of (timestamp, session_id, log_type, message, video_file, stream_key, channel_name) rows in one transaction
 
-def get_logs_from_database(session_id=None, limit=100):
-    """Get logs from database"""
+    Long-lived worker threads pass their own connection from open_db(); SQLite's locking then
+    replaces the shared connection's lock, so their writes don't hold up the script threads.
+    """
+    lock = nullcontext() if conn else get_db_lock()
+    conn = conn or get_db()
     try:
-        conn = sqlite3.connect("streaming_logs.db")
-        cursor = conn.cursor()
-        
-        if session_id:
-            cursor.execute('''
-                SELECT timestamp, log_type, message, video_file, channel_name
+        with lock, conn:
+            conn.execute("BEGIN")
+            conn.executemany('''
+                INSERT INTO streaming_logs 
+                (timestamp, session_id, log_type, message, video_file, stream_key, channel_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+    except sqlite3.Error as e:
+        raise DBError(f"Error logging to database: {e}") from e
+
+# Maximum number of UI log events waiting for the background writer
+LOG_QUEUE_SIZE = 10000
+
+@st.cache_resource
+def get_log_queue():
+    """Get the queue of pending log rows, starting its background writer on first use"""
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    threading.Thread(target=write_queued_logs, args=(log_queue,), daemon=True, name="log-writer").start()
+    atexit.register(drain_log_queue, log_queue)
+    return log_queue
+
+def write_queued_logs(log_queue):
+    """Write queued log rows in batches of up to LOG_BATCH_SIZE, at least every LOG_FLUSH_INTERVAL seconds"""
+    conn = open_db()
+    while True:
+        batch = [log_queue.get()]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while len(batch) < LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(log_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            log_many_to_database(batch, conn)
+        except DBError:
+            logger.exception("Dropped %d queued log rows", len(batch))
+
+def drain_log_queue(log_queue):
+    """Write whatever is still queued at interpreter exit"""
+    batch = []
+    while True:
+        try:
+            batch.append(log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        try:
+            log_many_to_database(batch)
+        except DBError:
+            logger.exception("Dropped %d queued log rows at exit", len(batch))
+
+def log_event(session_id, log_type, message, video_file=None):
+    """Queue a log message for the background writer; writes directly if the queue is full"""
+    row = (datetime.now().isoformat(), session_id, log_type, message, video_file, None, None)
+    try:
+        get_log_queue().put_nowait(row)
+    except queue.Full:
+        try:
+            log_many_to_database([row])
+        except DBError as e:
+            st.error(str(e))
+
+def get_logs_from_database(session_id=None, limit=100, before=None, log_type=None, message_length=None):
+    """Get (id, timestamp, log_type, message, video_file, channel_name) rows from database, newest first;
+    pass the (timestamp, id) of the oldest row already shown as `before` to page back
+    and a `message_length` to get messages cut down to that many characters"""
+    conditions, params = [], []
+    if session_id:
+        conditions.append("session_id = ?")
+        params.append(session_id)
+    if log_type:
+        conditions.append("log_type = ?")
+        params.append(log_type)
+    if before:
+        # Keyset on (timestamp, id) so rows sharing the boundary timestamp aren't skipped
+        conditions.append("(timestamp, id) < (?, ?)")
+        params.extend(before)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    message = "substr(message, 1, ?)" if message_length else "message"
+    if message_length:
+        params.insert(0, message_length)
+    try:
+        with get_db_lock():
+            cursor = get_db().execute(f'''
+                SELECT id, timestamp, log_type, {message}, video_file, channel_name
                 FROM streaming_logs 
-                WHERE session_id = ?
-                ORDER BY timestamp DESC 
+                {where}
+                ORDER BY timestamp DESC, id DESC 
                 LIMIT ?
-            ''', (session_id, limit))
-        else:
-            cursor.execute('''
-                SELECT timestamp, log_type, message, video_file, channel_name
+            ''', (*params, limit))
+            
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        raise DBError(f"Error getting logs from database: {e}") from e
+
+def get_log_message(log_id):
+    """Get the full message of a single log"""
+    try:
+        with get_db_lock():
+            row = get_db().execute(
+                'SELECT message FROM streaming_logs WHERE id = ?',
+                (log_id,)
+            ).fetchone()
+            return row[0] if row else None
+    except sqlite3.Error as e:
+        raise DBError(f"Error getting log from database: {e}") from e
+
+def export_logs_bytes(limit=1000):
+    """Get the newest logs as UTF-8 export bytes, formatted by SQLite and joined straight from the cursor"""
+    try:
+        with get_db_lock():
+            cursor = get_db().execute('''
+                SELECT CAST(printf('[%s] %s: %s', timestamp, log_type, message) AS BLOB)
                 FROM streaming_logs 
                 ORDER BY timestamp DESC 
                 LIMIT ?
             ''', (limit,))
-        
-        logs = cursor.fetchall()
-        conn.close()
-        return logs
-    except Exception as e:
-        st.error(f"Error getting logs from database: {e}")
+            cursor.arraysize = 500
+            return b"\n".join(row[0] for row in cursor)
+    except sqlite3.Error as e:
+        raise DBError(f"Error exporting logs from database: {e}") from e
+
+def get_logs_fingerprint():
+    """Get the newest log row id, which changes whenever a log is written"""
+    try:
+        with get_db_lock():
+            return get_db().execute('SELECT max(id) FROM streaming_logs').fetchone()[0]
+    except sqlite3.Error as e:
+        raise DBError(f"Error getting logs from database: {e}") from e
+
+@st.cache_data(ttl=2, show_spinner=False)
+def get_cached_logs(session_id, limit, before, log_type, message_length, fingerprint):
+    """Get logs from database, reusing the result until a new log is written"""
+    return get_logs_from_database(session_id, limit, before, log_type, message_length)
+
+def fetch_logs(session_id=None, limit=100, before=None, log_type=None, message_length=None):
+    """Get logs from database for display, reporting failures in the UI"""
+    try:
+        return get_cached_logs(session_id, limit, before, log_type, message_length, get_logs_fingerprint())
+    except DBError as e:
+        st.error(str(e))
         return []
 
-def save_streaming_session(session_id, video_file, stream_title, stream_description, tags, category, privacy_status, made_for_kids, channel_name):
-    """Save streaming session to database"""
+def save_streaming_session(session_id, video_file, stream_title, stream_description, tags, category, privacy_status, made_for_kids, channel_name, initial_logs=()):
+    """Save streaming session to database, with any initial (log_type, message) rows in the same transaction"""
     try:
-        conn = sqlite3.connect("streaming_logs.db")
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO streaming_sessions 
-            (session_id, start_time, video_file, stream_title, stream_description, tags, category, privacy_status, made_for_kids, channel_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            session_id,
-            datetime.now().isoformat(),
-            video_file,
-            stream_title,
-            stream_description,
-            tags,
-            category,
-            privacy_status,
-            made_for_kids,
-            channel_name
-        ))
-        
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        st.error(f"Error saving streaming session: {e}")
+        conn = get_db()
+        with get_db_lock(), conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute('''
+                INSERT OR REPLACE INTO streaming_sessions 
+                (session_id, start_time, video_file, stream_title, stream_description, tags, category, privacy_status, made_for_kids, channel_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                session_id,
+                datetime.now().isoformat(),
+                video_file,
+                stream_title,
+                stream_description,
+                tags,
+                category,
+                privacy_status,
+                made_for_kids,
+                channel_name
+            ))
+            if initial_logs:
+                now = datetime.now().isoformat()
+                conn.executemany('''
+                    INSERT INTO streaming_logs 
+                    (timestamp, session_id, log_type, message, video_file, stream_key, channel_name)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', [(now, session_id, log_type, message, video_file, None, None) for log_type, message in initial_logs])
+    except sqlite3.Error as e:
+        raise DBError(f"Error saving streaming session: {e}") from e
 
 def load_google_oauth_config(json_file):
     """Load Google OAuth configuration from downloaded JSON file"""
     try:
-        config = json.load(json_file)
+        config = json_loads(json_file.read())
         if 'web' in config:
             return config['web']
         elif 'installed' in config:
@@ -261,20 +466,23 @@ def generate_auth_url(client_config):
         scopes = ['https://www.googleapis.com/auth/youtube.force-ssl']
         
         # Create authorization URL
-        auth_url = (
-            f"{client_config['auth_uri']}?"
-            f"client_id={client_config['client_id']}&"
-            f"redirect_uri={urllib.parse.quote(client_config['redirect_uris'][0])}&"
-            f"scope={urllib.parse.quote(' '.join(scopes))}&"
-            f"response_type=code&"
-            f"access_type=offline&"
-            f"prompt=consent"
-        )
+        params = {
+            'client_id': client_config['client_id'],
+            'redirect_uri': client_config['redirect_uris'][0],
+            'scope': ' '.join(scopes),
+            'response_type': 'code',
+            'access_type': 'offline',
+            'prompt': 'consent'
+        }
+        auth_url = f"{client_config['auth_uri']}?{urllib.parse.urlencode(params, quote_via=urllib.parse.quote)}"
         return auth_url
     except Exception as e:
         st.error(f"Error generating auth URL: {e}")
         return None
 
+# (connect, read) timeout in seconds for the OAuth token endpoint
+OAUTH_TIMEOUT = (3.05, 10)
+
 def exchange_code_for_tokens(client_config, auth_code):
     """Exchange authorization code for access and refresh tokens"""
     try:
@@ -286,7 +494,7 @@ def exchange_code_for_tokens(client_config, auth_code):
             'redirect_uri': client_config['redirect_uris'][0]
         }
         
-        response = requests.post(client_config['token_uri'], data=token_data)
+        response = get_http_session().post(client_config['token_uri'], data=token_data, timeout=OAUTH_TIMEOUT)
         
         if response.status_code == 200:
             tokens = response.json()
@@ -301,7 +509,7 @@ def exchange_code_for_tokens(client_config, auth_code):
 def load_channel_config(json_file):
     """Load channel configuration from JSON file"""
     try:
-        config = json.load(json_file)
+        config = json_loads(json_file.read())
         return config
     except Exception as e:
         st.error(f"Error loading JSON file: {e}")
@@ -325,26 +533,71 @@ def validate_channel_config(config):
     
     return True, "Valid configuration"
 
+YOUTUBE_SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
+
+def build_youtube_service(refresh_token, client_id, client_secret, token_uri):
+    """Build a new YouTube API service from a refresh token, using the bundled discovery document"""
+    credentials = Credentials(
+        None,
+        refresh_token=refresh_token,
+        token_uri=token_uri,
+        client_id=client_id,
+        client_secret=client_secret,
+        scopes=YOUTUBE_SCOPES
+    )
+    return build('youtube', 'v3', credentials=credentials, cache_discovery=False, static_discovery=True)
+
+@st.cache_resource(show_spinner=False)
+def get_youtube_service(refresh_token, client_id, client_secret, token_uri):
+    """Build a YouTube API service once per refresh token"""
+    return build_youtube_service(refresh_token, client_id, client_secret, token_uri)
+
 def create_youtube_service(credentials_dict):
     """Create YouTube API service from credentials"""
     try:
+        if credentials_dict.get('refresh_token'):
+            return get_youtube_service(
+                credentials_dict['refresh_token'],
+                credentials_dict.get('client_id'),
+                credentials_dict.get('client_secret'),
+                credentials_dict.get('token_uri', 'https://oauth2.googleapis.com/token')
+            )
         if 'token' in credentials_dict:
             credentials = Credentials.from_authorized_user_info(credentials_dict)
         else:
             credentials = Credentials(
                 token=credentials_dict.get('access_token'),
-                refresh_token=credentials_dict.get('refresh_token'),
                 token_uri=credentials_dict.get('token_uri', 'https://oauth2.googleapis.com/token'),
                 client_id=credentials_dict.get('client_id'),
                 client_secret=credentials_dict.get('client_secret'),
-                scopes=['https://www.googleapis.com/auth/youtube.force-ssl']
+                scopes=YOUTUBE_SCOPES
             )
-        service = build('youtube', 'v3', credentials=credentials)
+        service = build('youtube', 'v3', credentials=credentials, cache_discovery=False, static_discovery=True)
         return service
     except Exception as e:
         st.error(f"Error creating YouTube service: {e}")
         return None
 
+@st.cache_resource
+def get_prefetch_executor():
+    """Get the thread pool used to warm YouTube API calls in the background"""
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yt-prefetch")
+    atexit.register(executor.shutdown, wait=False)
+    return executor
+
+def warm_channel(auth):
+    """Build the service for a saved channel and fetch its info (runs off the script thread, so no st.* calls).
+    The service is built privately rather than taken from the shared cache: its httplib2 transport is not
+    thread-safe, and the script thread only picks this one up once the warm-up has finished."""
+    service = build_youtube_service(
+        auth['refresh_token'],
+        auth.get('client_id'),
+        auth.get('client_secret'),
+        auth.get('token_uri', 'https://oauth2.googleapis.com/token')
+    )
+    response = service.channels().list(part="snippet,statistics", mine=True).execute()
+    return service, response.get('items', [])
+
 def get_stream_key_only(service):
     """Get stream key without creating broadcast"""
     try:
@@ -467,102 +720,228 @@ def create_live_stream(service, title, description, scheduled_start_time, tags=N
         return None
 
 def get_existing_broadcasts(service, max_results=10):
-    """Get existing live broadcasts"""
-    try:
-        request = service.liveBroadcasts().list(
-            part="snippet,status,contentDetails",
-            mine=True,
-            maxResults=max_results,
-            broadcastStatus="all"
-        )
-        response = request.execute()
-        return response.get('items', [])
-    except Exception as e:
-        st.error(f"Error getting existing broadcasts: {e}")
-        return []
+    """Get existing live broadcasts (API errors propagate to the caller)"""
+    request = service.liveBroadcasts().list(
+        part="snippet,status,contentDetails",
+        mine=True,
+        maxResults=max_results,
+        broadcastStatus="all"
+    )
+    response = request.execute()
+    return response.get('items', [])
+
+def get_streams_batch(service, stream_ids):
+    """Get ingestion info for many live streams, 50 ids per API call"""
+    stream_ids = list(dict.fromkeys(i for i in stream_ids if i))
+    streams = {}
+    for start in range(0, len(stream_ids), 50):
+        response = service.liveStreams().list(
+            part="cdn",
+            id=",".join(stream_ids[start:start + 50]),
+            maxResults=50
+        ).execute()
+        for item in response.get('items', []):
+            stream_info = item['cdn']['ingestionInfo']
+            streams[item['id']] = {
+                "stream_key": stream_info['streamName'],
+                "stream_url": stream_info['ingestionAddress'],
+                "stream_id": item['id']
+            }
+    return streams
 
-def get_broadcast_stream_key(service, broadcast_id):
+@st.cache_data(ttl=30, show_spinner=False)
+def get_broadcast_listing(channel_id, _service):
+    """Get existing broadcasts and their bound streams' keys, cached per channel for 30 seconds"""
+    broadcasts = get_existing_broadcasts(_service)
+    # Fetch every bound stream's key in one call instead of one per broadcast
+    streams = get_streams_batch(
+        _service,
+        [b.get('contentDetails', {}).get('boundStreamId') for b in broadcasts]
+    )
+    return broadcasts, streams
+
+def get_broadcast_stream_key(service, broadcast_id, stream_id=None):
     """Get stream key for existing broadcast"""
     try:
-        # Get broadcast details
-        broadcast_request = service.liveBroadcasts().list(
-            part="contentDetails",
-            id=broadcast_id
-        )
-        broadcast_response = broadcast_request.execute()
-        
-        if not broadcast_response['items']:
-            return None
+        if not stream_id:
+            # Get broadcast details
+            broadcast_request = service.liveBroadcasts().list(
+                part="contentDetails",
+                id=broadcast_id
+            )
+            broadcast_response = broadcast_request.execute()
             
-        stream_id = broadcast_response['items'][0]['contentDetails'].get('boundStreamId')
+            if not broadcast_response['items']:
+                return None
+                
+            stream_id = broadcast_response['items'][0]['contentDetails'].get('boundStreamId')
         
         if not stream_id:
             return None
             
         # Get stream details
-        stream_request = service.liveStreams().list(
-            part="cdn",
-            id=stream_id
-        )
-        stream_response = stream_request.execute()
-        
-        if stream_response['items']:
-            stream_info = stream_response['items'][0]['cdn']['ingestionInfo']
-            return {
-                "stream_key": stream_info['streamName'],
-                "stream_url": stream_info['ingestionAddress'],
-                "stream_id": stream_id
-            }
-        
-        return None
+        return get_streams_batch(service, [stream_id]).get(stream_id)
     except Exception as e:
         st.error(f"Error getting broadcast stream key: {e}")
         return None
 
-def run_ffmpeg(video_path, stream_key, is_shorts, log_callback, rtmp_url=None, session_id=None):
-    """Run FFmpeg for streaming with enhanced logging"""
+# FFmpeg output is written to the database in batches of this many lines, or at least this often (seconds)
+LOG_BATCH_SIZE = 200
+LOG_FLUSH_INTERVAL = 1.0
+
+# FFmpeg output is pushed to the live log view at most this often (seconds); every line still reaches the database
+UI_LOG_INTERVAL = 0.2
+
+# Number of live log lines kept in memory
+LIVE_LOG_LIMIT = 100
+
+VIDEO_EXTENSIONS = ('.mp4', '.flv', '.avi', '.mov', '.mkv')
+
+@st.cache_data(ttl=5, show_spinner=False)
+def list_videos(dir_mtime_ns):
+    """List video files in the current directory (keyed on its mtime, so adds and removes invalidate the cache)"""
+    return [f for f in os.listdir('.') if f.endswith(VIDEO_EXTENSIONS)]
+
+# Buffer size used when writing uploaded videos to disk
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Render node used for VAAPI hardware encoding
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# Codec options per H.264 encoder, shared by the startup probe and the stream itself
+_ENCODER_ARGS = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "ll", "-rc", "cbr"],
+    "h264_vaapi": ["-c:v", "h264_vaapi"],
+    "libx264": ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "zerolatency", "-x264-params", "nal-hrd=cbr"],
+}
+
+@st.cache_resource(show_spinner=False)
+def get_h264_encoder():
+    """Pick the H.264 encoder to stream with, preferring GPU encoders that actually work on this host"""
+    candidates = [
+        ("h264_nvenc", [], []),
+        ("h264_vaapi", ["-vaapi_device", VAAPI_DEVICE], ["-vf", "format=nv12,hwupload"]),
+    ]
+    for encoder, hw_args, vf_args in candidates:
+        # Listed encoders may still lack a usable device or reject our options, so encode one test frame
+        probe = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", *hw_args,
+            "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+            *vf_args, *_ENCODER_ARGS[encoder], "-frames:v", "1", "-f", "null", "-"
+        ]
+        try:
+            if subprocess.run(probe, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15).returncode == 0:
+                return encoder
+        except (OSError, subprocess.SubprocessError):
+            pass
+    return "libx264"
+
+def run_ffmpeg(video_path, stream_key, is_shorts, log_callback, rtmp_url=None, session_id=None, process_holder=None):
+    """Run FFmpeg for streaming with enhanced logging; the process is stored in process_holder['process'] so it can be stopped"""
     output_url = rtmp_url or f"rtmp://a.rtmp.youtube.com/live2/{stream_key}"
-    scale = "-vf scale=720:1280" if is_shorts else ""
-    cmd = [
-        "ffmpeg", "-re", "-stream_loop", "-1", "-i", video_path,
-        "-c:v", "libx264", "-preset", "veryfast", "-b:v", "2500k",
-        "-maxrate", "2500k", "-bufsize", "5000k",
+    encoder = get_h264_encoder()
+    cmd = ["ffmpeg"]
+    if encoder == "h264_vaapi":
+        cmd += ["-vaapi_device", VAAPI_DEVICE]
+    cmd += ["-re", "-stream_loop", "-1", "-i", video_path]
+    
+    if encoder == "h264_vaapi":
+        # Upload once and scale on the GPU
+        vf = "format=nv12,hwupload" + (",scale_vaapi=w=720:h=1280" if is_shorts else "")
+        cmd += ["-vf", vf]
+    elif is_shorts:
+        cmd += ["-vf", "scale=720:1280"]
+    cmd += _ENCODER_ARGS[encoder]
+    
+    cmd += [
+        "-b:v", "2500k", "-maxrate", "2500k", "-bufsize", "5000k",
         "-g", "60", "-keyint_min", "60",
         "-c:a", "aac", "-b:a", "128k",
-        "-f", "flv"
+        "-f", "flv", output_url
     ]
-    if scale:
-        cmd += scale.split()
-    cmd.append(output_url)
+    
+    # Runs on a background thread, so database failures go to the logger rather than st.error
+    def db_log(log_type, message):
+        if session_id:
+            try:
+                log_to_database(session_id, log_type, message, video_path)
+            except DBError:
+                logger.exception("Failed to log FFmpeg event for session %s", session_id)
     
     start_msg = f"🚀 Starting FFmpeg: {' '.join(cmd[:8])}... [RTMP URL hidden for security]"
     log_callback(start_msg)
+    db_log("INFO", start_msg)
+    
+    # This thread writes its log batches through its own connection
+    db_conn = None
     if session_id:
-        log_to_database(session_id, "INFO", start_msg, video_path)
+        try:
+            db_conn = open_db()
+        except sqlite3.Error:
+            logger.exception("Falling back to the shared database connection for session %s", session_id)
+    
+    log_buffer = []
+    last_flush = time.monotonic()
+    next_ui_push = 0.0
+    
+    def flush_logs():
+        nonlocal last_flush
+        if log_buffer:
+            try:
+                log_many_to_database(log_buffer, db_conn)
+            except DBError:
+                logger.exception("Dropped %d FFmpeg log lines for session %s", len(log_buffer), session_id)
+            log_buffer.clear()
+        last_flush = time.monotonic()
+    
+    def handle_line(raw):
+        nonlocal next_ui_push
+        now = time.monotonic()
+        push_ui = now >= next_ui_push
+        if not (push_ui or session_id):
+            return
+        line = raw.decode("utf-8", "replace")
+        if push_ui:
+            log_callback(line)
+            next_ui_push = now + UI_LOG_INTERVAL
+        if session_id:
+            log_buffer.append((datetime.now().isoformat(), session_id, "FFMPEG", line, video_path, None, None))
+            if len(log_buffer) >= LOG_BATCH_SIZE or now - last_flush >= LOG_FLUSH_INTERVAL:
+                flush_logs()
     
     try:
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-        for line in process.stdout:
-            log_callback(line.strip())
-            if session_id:
-                log_to_database(session_id, "FFMPEG", line.strip(), video_path)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1 << 16)
+        if process_holder is not None:
+            process_holder['process'] = process
+        # Read whatever is available in binary and split it ourselves; FFmpeg ends progress lines with \r
+        pending = b""
+        for chunk in iter(lambda: process.stdout.read1(1 << 16), b""):
+            lines = (pending + chunk).replace(b"\r", b"\n").split(b"\n")
+            pending = lines.pop()
+            for raw in lines:
+                raw = raw.strip()
+                if raw:
+                    handle_line(raw)
+        if pending.strip():
+            handle_line(pending.strip())
         process.wait()
+        flush_logs()
         
         end_msg = "✅ Streaming completed successfully"
         log_callback(end_msg)
-        if session_id:
-            log_to_database(session_id, "INFO", end_msg, video_path)
+        db_log("INFO", end_msg)
             
     except Exception as e:
         error_msg = f"❌ FFmpeg Error: {e}"
         log_callback(error_msg)
-        if session_id:
-            log_to_database(session_id, "ERROR", error_msg, video_path)
+        db_log("ERROR", error_msg)
     finally:
+        flush_logs()
         final_msg = "⏹️ Streaming session ended"
         log_callback(final_msg)
-        if session_id:
-            log_to_database(session_id, "INFO", final_msg, video_path)
+        db_log("INFO", final_msg)
+        if db_conn:
+            db_conn.close()
 
 def auto_process_auth_code():
     """Automatically process authorization code from URL"""
@@ -607,7 +986,7 @@ def auto_process_auth_code():
                                 st.session_state['channel_info'] = channel
                                 
                                 # Save channel authentication persistently
-                                save_channel_auth(
+                                save_channel_auth_in_background(
                                     channel['snippet']['title'],
                                     channel['id'],
                                     creds_dict
@@ -625,24 +1004,67 @@ def auto_process_auth_code():
             else:
                 st.error("❌ OAuth configuration not found. Please upload OAuth JSON first.")
 
+_YT_CATEGORIES = MappingProxyType({
+    "1": "Film & Animation",
+    "2": "Autos & Vehicles", 
+    "10": "Music",
+    "15": "Pets & Animals",
+    "17": "Sports",
+    "19": "Travel & Events",
+    "20": "Gaming",
+    "22": "People & Blogs",
+    "23": "Comedy",
+    "24": "Entertainment",
+    "25": "News & Politics",
+    "26": "Howto & Style",
+    "27": "Education",
+    "28": "Science & Technology"
+})
+
+# Inverse of _YT_CATEGORIES, for turning the selected name back into its id
+_YT_CATEGORY_IDS = MappingProxyType({name: category_id for category_id, name in _YT_CATEGORIES.items()})
+
+# Category picker options and its default selection
+_YT_CATEGORY_NAMES = tuple(_YT_CATEGORIES.values())
+_YT_DEFAULT_CATEGORY_INDEX = _YT_CATEGORY_NAMES.index("Gaming")
+
 def get_youtube_categories():
     """Get YouTube video categories"""
-    return {
-        "1": "Film & Animation",
-        "2": "Autos & Vehicles", 
-        "10": "Music",
-        "15": "Pets & Animals",
-        "17": "Sports",
-        "19": "Travel & Events",
-        "20": "Gaming",
-        "22": "People & Blogs",
-        "23": "Comedy",
-        "24": "Entertainment",
-        "25": "News & Politics",
-        "26": "Howto & Style",
-        "27": "Education",
-        "28": "Science & Technology"
-    }
+    return _YT_CATEGORIES
+
+def get_youtube_category_id(category_name):
+    """Get the YouTube category id for a category name"""
+    return _YT_CATEGORY_IDS[category_name]
+
+def parse_tags(tags_input):
+    """Split comma-separated tags, dropping blanks"""
+    if not tags_input:
+        return []
+    return [tag for tag in map(str.strip, tags_input.split(",")) if tag]
+
+# Element and format used to show a stored log row, by log type
+_LOG_RENDERERS = {
+    "ERROR": (st.error, "**{0}** - {1}"),
+    "INFO": (st.info, "**{0}** - {1}"),
+    "FFMPEG": (st.text, "{0} - {1}"),
+}
+_DEFAULT_LOG_RENDERER = (st.write, "**{0}** - {1}")
+
+# Seconds between live log panel refreshes while streaming
+LIVE_LOG_REFRESH = 2
+
+# Characters of each message loaded into the historical logs table
+LOG_SNIPPET_LENGTH = 80
+
+def live_logs_panel():
+    """Render the tail of the live FFmpeg logs"""
+    if 'live_logs' in st.session_state and st.session_state['live_logs']:
+        # Show last 50 live logs
+        live_logs = st.session_state['live_logs']
+        logs_text = "\n".join(islice(live_logs, max(len(live_logs) - 50, 0), None))
+        st.text_area("Live Logs", logs_text, height=300, disabled=True, key="live_logs_display")
+    else:
+        st.info("No live logs available. Start streaming to see real-time logs.")
 
 def main():
     # Page configuration must be the first Streamlit command
@@ -653,14 +1075,23 @@ def main():
     )
     
     # Initialize database
-    init_database()
+    try:
+        init_database()
+    except DBError as e:
+        st.error(str(e))
+    
+    # Create (and warm) the OAuth HTTP session before it is first needed
+    get_http_session()
+    
+    # Looked up once per run and shared by the category picker and the live broadcast summary
+    categories = get_youtube_categories()
     
     # Initialize session state
     if 'session_id' not in st.session_state:
         st.session_state['session_id'] = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
     if 'live_logs' not in st.session_state:
-        st.session_state['live_logs'] = []
+        st.session_state['live_logs'] = deque(maxlen=LIVE_LOG_LIMIT)
     
     st.title("🎥 Advanced YouTube Live Streaming Platform")
     st.markdown("---")
@@ -677,7 +1108,18 @@ def main():
         
         # Saved Channels Section
         st.subheader("💾 Saved Channels")
-        saved_channels = load_saved_channels()
+        try:
+            saved_channels = load_saved_channels()
+        except DBError as e:
+            st.error(str(e))
+            saved_channels = []
+        
+        # Warm the most recently used channel while the user looks at the page
+        if saved_channels and '_warmed_channel' not in st.session_state and saved_channels[0]['auth'].get('refresh_token'):
+            st.session_state['_warmed_channel'] = (
+                saved_channels[0]['name'],
+                get_prefetch_executor().submit(warm_channel, saved_channels[0]['auth'])
+            )
         
         if saved_channels:
             st.write("**Previously authenticated channels:**")
@@ -689,16 +1131,24 @@ def main():
                 
                 with col2:
                     if st.button("🔑 Use", key=f"use_{channel['name']}"):
-                        # Load this channel's authentication
-                        service = create_youtube_service(channel['auth'])
-                        if service:
+                        warmed = st.session_state.get('_warmed_channel')
+                        if warmed and warmed[0] == channel['name'] and warmed[1].done() and not warmed[1].exception():
+                            # Already loaded in the background
+                            service, channels = warmed[1].result()
+                        else:
+                            # Load this channel's authentication
+                            service = create_youtube_service(channel['auth'])
                             # Verify the authentication is still valid
-                            channels = get_channel_info(service)
+                            channels = get_channel_info(service) if service else []
+                        if service:
                             if channels:
                                 channel_info = channels[0]
                                 st.session_state['youtube_service'] = service
                                 st.session_state['channel_info'] = channel_info
-                                update_channel_last_used(channel['name'])
+                                try:
+                                    update_channel_last_used(channel['name'])
+                                except DBError as e:
+                                    st.error(str(e))
                                 st.success(f"✅ Loaded: {channel['name']}")
                                 st.rerun()
                             else:
@@ -763,7 +1213,7 @@ def main():
                                             st.session_state['channel_info'] = channel
                                             
                                             # Save channel authentication persistently
-                                            save_channel_auth(
+                                            save_channel_auth_in_background(
                                                 channel['snippet']['title'],
                                                 channel['id'],
                                                 creds_dict
@@ -781,6 +1231,8 @@ def main():
                 is_valid, message = validate_channel_config(config)
                 if is_valid:
                     st.success("✅ Valid configuration loaded")
+                    # Index channels by name once; reversed so the first of any duplicate names wins
+                    config['_by_name'] = {ch['name']: ch for ch in reversed(config['channels'])}
                     st.session_state['channel_config'] = config
                 else:
                     st.error(f"❌ Invalid configuration: {message}")
@@ -796,17 +1248,20 @@ def main():
         
         with col_log2:
             if st.button("🗑️ Clear Session Logs"):
-                st.session_state['live_logs'] = []
+                st.session_state['live_logs'].clear()
                 st.success("Logs cleared!")
         
         # Export logs
         if st.button("📥 Export All Logs"):
-            all_logs = get_logs_from_database(limit=1000)
-            if all_logs:
-                logs_text = "\n".join([f"[{log[0]}] {log[1]}: {log[2]}" for log in all_logs])
+            try:
+                logs_data = export_logs_bytes(limit=1000)
+            except DBError as e:
+                st.error(str(e))
+                logs_data = b""
+            if logs_data:
                 st.download_button(
                     label="💾 Download Logs",
-                    data=logs_text,
+                    data=logs_data,
                     file_name=f"streaming_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
                     mime="text/plain"
                 )
@@ -818,7 +1273,7 @@ def main():
         st.header("🎥 Video & Streaming Setup")
         
         # Video selection
-        video_files = [f for f in os.listdir('.') if f.endswith(('.mp4', '.flv', '.avi', '.mov', '.mkv'))]
+        video_files = list_videos(os.stat('.').st_mtime_ns)
         
         if video_files:
             st.write("📁 Available videos:")
@@ -831,11 +1286,13 @@ def main():
         uploaded_file = st.file_uploader("Or upload new video", type=['mp4', 'flv', 'avi', 'mov', 'mkv'])
         
         if uploaded_file:
-            with open(uploaded_file.name, "wb") as f:
-                f.write(uploaded_file.read())
+            # Copy in 8 MiB chunks rather than materializing another full copy of the video
+            uploaded_file.seek(0)
+            with open(uploaded_file.name, "wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+                shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
             st.success("✅ Video uploaded successfully!")
             video_path = uploaded_file.name
-            log_to_database(st.session_state['session_id'], "INFO", f"Video uploaded: {uploaded_file.name}")
+            log_event(st.session_state['session_id'], "INFO", f"Video uploaded: {uploaded_file.name}")
         elif selected_video:
             video_path = selected_video
         else:
@@ -897,7 +1354,7 @@ def main():
                                 st.session_state['current_stream_key'] = stream_key
                                 st.session_state['current_stream_info'] = stream_info
                                 st.success("✅ Stream key obtained!")
-                                log_to_database(st.session_state['session_id'], "INFO", "Stream key generated successfully")
+                                log_event(st.session_state['session_id'], "INFO", "Stream key generated successfully")
                                 
                                 # Display stream information
                                 st.info("🔑 **Stream Key Generated** (for external streaming software)")
@@ -909,7 +1366,7 @@ def main():
                     except Exception as e:
                         error_msg = f"Error getting stream key: {e}"
                         st.error(error_msg)
-                        log_to_database(st.session_state['session_id'], "ERROR", error_msg)
+                        log_event(st.session_state['session_id'], "ERROR", error_msg)
             
             with col_btn2:
                 if st.button("🎬 Create YouTube Live", type="primary", help="Create complete YouTube Live broadcast (appears in Studio)"):
@@ -917,7 +1374,7 @@ def main():
                     stream_title = st.session_state.get('stream_title_input', 'Live Stream')
                     stream_description = st.session_state.get('stream_description_input', 'Live streaming session')
                     tags_input = st.session_state.get('tags_input', '')
-                    tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()] if tags_input else []
+                    tags = parse_tags(tags_input)
                     category_id = st.session_state.get('category_id', "20")
                     privacy_status = st.session_state.get('privacy_status', "public")
                     made_for_kids = st.session_state.get('made_for_kids', False)
@@ -951,7 +1408,7 @@ def main():
                                 with col_info1:
                                     st.write(f"**🎬 Title:** {stream_title}")
                                     st.write(f"**🔒 Privacy:** {privacy_status.title()}")
-                                    st.write(f"**📂 Category:** {get_youtube_categories().get(category_id, 'Unknown')}")
+                                    st.write(f"**📂 Category:** {categories.get(category_id, 'Unknown')}")
                                 
                                 with col_info2:
                                     st.write(f"**🏷️ Tags:** {', '.join(tags) if tags else 'None'}")
@@ -972,18 +1429,19 @@ def main():
                                 
                                 st.success("✅ **Ready to stream!** Use the stream key above or click 'Start Streaming' below.")
                                 
-                                log_to_database(st.session_state['session_id'], "INFO", f"YouTube Live created: {live_info['watch_url']}")
+                                log_event(st.session_state['session_id'], "INFO", f"YouTube Live created: {live_info['watch_url']}")
                     except Exception as e:
                         error_msg = f"Error creating YouTube Live: {e}"
                         st.error(error_msg)
-                        log_to_database(st.session_state['session_id'], "ERROR", error_msg)
+                        log_event(st.session_state['session_id'], "ERROR", error_msg)
             
             with col_btn3:
                 if st.button("📋 View Existing Streams", help="View and manage existing live broadcasts"):
                     try:
                         service = st.session_state['youtube_service']
                         with st.spinner("Loading existing broadcasts..."):
-                            broadcasts = get_existing_broadcasts(service)
+                            channel_id = st.session_state.get('channel_info', {}).get('id')
+                            broadcasts, streams = get_broadcast_listing(channel_id, service)
                             
                             if broadcasts:
                                 st.success(f"📺 Found {len(broadcasts)} existing broadcasts:")
@@ -1007,7 +1465,8 @@ def main():
                                             
                                             if st.button(f"🔑 Use This Stream", key=f"use_broadcast_{i}"):
                                                 # Get stream key for this broadcast
-                                                stream_info = get_broadcast_stream_key(service, broadcast['id'])
+                                                bound_stream_id = broadcast.get('contentDetails', {}).get('boundStreamId')
+                                                stream_info = streams.get(bound_stream_id) or get_broadcast_stream_key(service, broadcast['id'])
                                                 if stream_info:
                                                     st.session_state['current_stream_key'] = stream_info['stream_key']
                                                     st.session_state['live_broadcast_info'] = {
@@ -1026,7 +1485,7 @@ def main():
                     except Exception as e:
                         error_msg = f"Error loading existing broadcasts: {e}"
                         st.error(error_msg)
-                        log_to_database(st.session_state['session_id'], "ERROR", error_msg)
+                        log_event(st.session_state['session_id'], "ERROR", error_msg)
         
         # Channel selection from JSON config
         elif 'channel_config' in st.session_state:
@@ -1036,7 +1495,7 @@ def main():
             selected_channel_name = st.selectbox("Select channel", channel_options)
             
             # Find selected channel
-            selected_channel = next((ch for ch in config['channels'] if ch['name'] == selected_channel_name), None)
+            selected_channel = config['_by_name'].get(selected_channel_name)
             
             if selected_channel:
                 if 'current_stream_key' not in st.session_state:
@@ -1055,7 +1514,7 @@ def main():
                                 st.success(f"✅ Authenticated as: {channel['snippet']['title']}")
                                 st.write(f"Subscribers: {channel['statistics'].get('subscriberCount', 'Hidden')}")
                                 st.write(f"Total Views: {channel['statistics'].get('viewCount', '0')}")
-                                log_to_database(st.session_state['session_id'], "INFO", f"Channel authenticated: {channel['snippet']['title']}")
+                                log_event(st.session_state['session_id'], "INFO", f"Channel authenticated: {channel['snippet']['title']}")
                             else:
                                 st.error("❌ Could not fetch channel information")
         else:
@@ -1089,10 +1548,8 @@ def main():
             made_for_kids = st.checkbox("👶 Made for Kids", key="made_for_kids")
         
         with col_basic2:
-            categories = get_youtube_categories()
-            category_names = list(categories.values())
-            selected_category_name = st.selectbox("📂 Category", category_names, index=category_names.index("Gaming"))
-            category_id = [k for k, v in categories.items() if v == selected_category_name][0]
+            selected_category_name = st.selectbox("📂 Category", _YT_CATEGORY_NAMES, index=_YT_DEFAULT_CATEGORY_INDEX)
+            category_id = get_youtube_category_id(selected_category_name)
             st.session_state['category_id'] = category_id
             
             # Stream schedule type
@@ -1109,7 +1566,7 @@ def main():
         tags_input = st.text_input("🏷️ Tags (comma separated)", 
                                  placeholder="gaming, live, stream, youtube",
                                  key="tags_input")
-        tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()] if tags_input else []
+        tags = parse_tags(tags_input)
         
         if tags:
             st.write("**Tags:**", ", ".join(tags))
@@ -1169,50 +1626,58 @@ def main():
                 st.error("❌ Stream key is required!")
             else:
                 # Save streaming session
-                save_streaming_session(
-                    st.session_state['session_id'],
-                    video_path,
-                    stream_title,
-                    stream_description,
-                    ", ".join(tags),
-                    category_id,
-                    privacy_status,
-                    made_for_kids,
-                    st.session_state.get('channel_info', {}).get('snippet', {}).get('title', 'Unknown')
-                )
+                try:
+                    save_streaming_session(
+                        st.session_state['session_id'],
+                        video_path,
+                        stream_title,
+                        stream_description,
+                        ", ".join(tags),
+                        category_id,
+                        privacy_status,
+                        made_for_kids,
+                        st.session_state.get('channel_info', {}).get('snippet', {}).get('title', 'Unknown'),
+                        initial_logs=[("INFO", f"Streaming started: {video_path}")]
+                    )
+                except DBError as e:
+                    st.error(str(e))
                 
                 # Start streaming
                 st.session_state['streaming'] = True
                 st.session_state['stream_start_time'] = datetime.now()
-                st.session_state['live_logs'] = []
+                live_logs = st.session_state['live_logs']
+                live_logs.clear()
                 
                 def log_callback(msg):
-                    if 'live_logs' not in st.session_state:
-                        st.session_state['live_logs'] = []
-                    st.session_state['live_logs'].append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
-                    # Keep only last 100 logs in memory
-                    if len(st.session_state['live_logs']) > 100:
-                        st.session_state['live_logs'] = st.session_state['live_logs'][-100:]
+                    # The deque keeps only the last LIVE_LOG_LIMIT logs in memory
+                    live_logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
                 
+                # Filled in by run_ffmpeg so this session can stop its own FFmpeg process
+                st.session_state['ffmpeg_proc'] = {}
                 st.session_state['ffmpeg_thread'] = threading.Thread(
                     target=run_ffmpeg, 
-                    args=(video_path, stream_key, is_shorts, log_callback, custom_rtmp or None, st.session_state['session_id']), 
+                    args=(video_path, stream_key, is_shorts, log_callback, custom_rtmp or None, st.session_state['session_id'], st.session_state['ffmpeg_proc']), 
                     daemon=True
                 )
                 st.session_state['ffmpeg_thread'].start()
                 st.success("🚀 Streaming started!")
-                log_to_database(st.session_state['session_id'], "INFO", f"Streaming started: {video_path}")
                 st.rerun()
         
         if st.button("⏹️ Stop Streaming", type="secondary"):
             st.session_state['streaming'] = False
             if 'stream_start_time' in st.session_state:
                 del st.session_state['stream_start_time']
-            os.system("pkill ffmpeg")
+            process = st.session_state.get('ffmpeg_proc', {}).get('process')
+            if process and process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
             if os.path.exists("temp_video.mp4"):
                 os.remove("temp_video.mp4")
             st.warning("⏸️ Streaming stopped!")
-            log_to_database(st.session_state['session_id'], "INFO", "Streaming stopped by user")
+            log_event(st.session_state['session_id'], "INFO", "Streaming stopped by user")
             st.rerun()
         
         # Live broadcast info
@@ -1228,7 +1693,7 @@ def main():
         st.subheader("📈 Statistics")
         
         # Session stats
-        session_logs = get_logs_from_database(st.session_state['session_id'], 50)
+        session_logs = fetch_logs(st.session_state['session_id'], 50)
         st.metric("Session Logs", len(session_logs))
         
         if 'live_logs' in st.session_state:
@@ -1260,76 +1725,93 @@ def main():
     with tab1:
         st.subheader("Real-time Streaming Logs")
         
-        # Live logs container
-        log_container = st.container()
-        with log_container:
-            if 'live_logs' in st.session_state and st.session_state['live_logs']:
-                # Show last 50 live logs
-                recent_logs = st.session_state['live_logs'][-50:]
-                logs_text = "\n".join(recent_logs)
-                st.text_area("Live Logs", logs_text, height=300, disabled=True, key="live_logs_display")
-            else:
-                st.info("No live logs available. Start streaming to see real-time logs.")
-        
         # Auto-refresh toggle
         auto_refresh = st.checkbox("🔄 Auto-refresh logs", value=streaming)
         
-        if auto_refresh and streaming:
-            time.sleep(2)
-            st.rerun()
+        # Only the log panel reruns on each refresh tick, not the whole script
+        st.fragment(live_logs_panel, run_every=LIVE_LOG_REFRESH if auto_refresh and streaming else None)()
     
     with tab2:
         st.subheader("Current Session History")
         
-        session_logs = get_logs_from_database(st.session_state['session_id'], 100)
+        # Show last 20 session logs, capped in the query rather than sliced afterwards
+        session_logs = fetch_logs(st.session_state['session_id'], 20)
         if session_logs:
             # Create a formatted display
-            for log in session_logs[:20]:  # Show last 20 session logs
-                timestamp, log_type, message, video_file, channel_name = log
+            for log in session_logs:
+                _, timestamp, log_type, message, video_file, channel_name = log
                 
                 # Color code by log type
-                if log_type == "ERROR":
-                    st.error(f"**{timestamp}** - {message}")
-                elif log_type == "INFO":
-                    st.info(f"**{timestamp}** - {message}")
-                elif log_type == "FFMPEG":
-                    st.text(f"{timestamp} - {message}")
-                else:
-                    st.write(f"**{timestamp}** - {message}")
+                render, fmt = _LOG_RENDERERS.get(log_type, _DEFAULT_LOG_RENDERER)
+                render(fmt.format(timestamp, message))
         else:
             st.info("No session logs available yet.")
     
     with tab3:
         st.subheader("All Historical Logs")
         
-        # Filter options
-        col_filter1, col_filter2 = st.columns(2)
-        
-        with col_filter1:
-            log_limit = st.selectbox("Show logs", [50, 100, 200, 500], index=1)
-        
-        with col_filter2:
-            log_type_filter = st.selectbox("Filter by type", ["All", "INFO", "ERROR", "FFMPEG"])
+        # Filter options, applied together on submit rather than rerunning on every change
+        with st.form("log_filter"):
+            col_filter1, col_filter2 = st.columns(2)
+
+            with col_filter1:
+                log_limit = st.selectbox("Show logs", [50, 100, 200, 500], index=1)
+
+            with col_filter2:
+                log_type_filter = st.selectbox("Filter by type", ["All", "INFO", "ERROR", "FFMPEG"])
+
+            applied = st.form_submit_button("Apply")
+        
+        # Keyset pagination: each entry is the (timestamp, id) of the oldest row of a page already viewed;
+        # a cursor only makes sense for the filters it was taken under, so start over when they change
+        if applied or 'log_page_cursors' not in st.session_state:
+            st.session_state['log_page_cursors'] = []
+        cursors = st.session_state['log_page_cursors']
+        
+        all_logs = fetch_logs(
+            limit=log_limit,
+            before=cursors[-1] if cursors else None,
+            log_type=None if log_type_filter == "All" else log_type_filter,
+            message_length=LOG_SNIPPET_LENGTH
+        )
         
-        all_logs = get_logs_from_database(limit=log_limit)
+        col_page1, col_page2 = st.columns(2)
+        with col_page1:
+            if cursors and st.button("⬅️ Newer logs"):
+                cursors.pop()
+                st.rerun()
+        with col_page2:
+            if len(all_logs) == log_limit and st.button("Older logs ➡️"):
+                cursors.append((all_logs[-1][1], all_logs[-1][0]))
+                st.rerun()
         
         if all_logs:
-            # Filter by type if selected
-            if log_type_filter != "All":
-                all_logs = [log for log in all_logs if log[1] == log_type_filter]
+            logs_df = pd.DataFrame(all_logs, columns=["id", "timestamp", "type", "message", "video", "channel"])
             
-            # Display in expandable sections
-            for i, log in enumerate(all_logs[:50]):  # Limit display to 50 for performance
-                timestamp, log_type, message, video_file, channel_name = log
-                
-                with st.expander(f"{log_type} - {timestamp} - {message[:50]}..."):
-                    st.write(f"**Timestamp:** {timestamp}")
-                    st.write(f"**Type:** {log_type}")
-                    st.write(f"**Message:** {message}")
-                    if video_file:
-                        st.write(f"**Video File:** {video_file}")
-                    if channel_name:
-                        st.write(f"**Channel:** {channel_name}")
+            # One virtualized table instead of an expander per row; select a row to see its details
+            event = st.dataframe(
+                logs_df,
+                use_container_width=True,
+                hide_index=True,
+                column_order=["timestamp", "type", "message", "video", "channel"],
+                on_select="rerun",
+                selection_mode="single-row",
+                key="historical_logs_table"
+            )
+            
+            if event.selection.rows:
+                log_id, timestamp, log_type, message, video_file, channel_name = logs_df.iloc[event.selection.rows[0]]
+                # The table only holds a snippet; load the full message for the selected log
+                try:
+                    message = get_log_message(int(log_id)) or message
+                except DBError as e:
+                    st.error(str(e))
+                details = [f"**Timestamp:** {timestamp}", f"**Type:** {log_type}", f"**Message:** {message}"]
+                if video_file:
+                    details.append(f"**Video File:** {video_file}")
+                if channel_name:
+                    details.append(f"**Channel:** {channel_name}")
+                st.markdown("  \n".join(details))
         else:
             st.info("No historical logs available.")
 